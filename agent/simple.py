@@ -1,5 +1,6 @@
 # flake8: noqa: E501
 
+import asyncio
 import logging
 
 from dotenv import load_dotenv
@@ -17,6 +18,13 @@ from livekit.plugins import google, noise_cancellation
 
 load_dotenv()
 
+try:
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 logger = logging.getLogger("vision-assistant")
 
 SYSTEM_PROMPT = """
@@ -55,7 +63,7 @@ If asked about yourself, you should identify yourself as "Viz", the helpful vide
 
 class VisionAssistant(Agent):
     def __init__(self) -> None:
-        self._tasks = []
+        self._tasks: set[asyncio.Task] = set()
         super().__init__(
             instructions=SYSTEM_PROMPT,
             llm=google.beta.realtime.RealtimeModel(
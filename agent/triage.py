@@ -1,5 +1,6 @@
 # flake8: noqa: E501
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
 from typing import Optional
@@ -21,6 +22,13 @@ from utils import load_prompt
 
 load_dotenv()
 
+try:
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 logger = logging.getLogger("medical-vision-assistant")
 logger.setLevel(logging.INFO)
 
@@ -28,6 +36,16 @@ MODEL = "gemini-live-2.5-flash-preview"
 TEMP = 0.8
 
 
+def _realtime_model(voice: str) -> google.beta.realtime.RealtimeModel:
+    """Build a RealtimeModel with the shared model and temperature settings"""
+
+    return google.beta.realtime.RealtimeModel(
+        model=MODEL,
+        voice=voice,
+        temperature=TEMP,
+    )
+
+
 @dataclass
 class UserData:
     """Stores data and agents to be shared across the session"""
@@ -41,7 +59,9 @@ class UserData:
 
 
 class BaseAgent(Agent):
-    def __init__(self, instructions: str, **kwargs):
+    def __init__(self, instructions: str, voice: Optional[str] = None, **kwargs):
+        if voice:  # per-agent voice override, fresh model for this agent
+            kwargs.setdefault("llm", _realtime_model(voice))
         super().__init__(
             instructions=instructions,
             **kwargs,
@@ -94,11 +114,7 @@ class SupportAgent(BaseAgent):
     def __init__(self) -> None:
         super().__init__(
             instructions=load_prompt("support_prompt.yaml"),
-            llm=google.beta.realtime.RealtimeModel(
-                model=MODEL,
-                voice="Charon",  # custom voice for support agent
-                temperature=TEMP,
-            ),
+            voice="Charon",  # custom voice for support agent
         )
 
     @function_tool
@@ -114,11 +130,7 @@ class BillingAgent(BaseAgent):
     def __init__(self) -> None:
         super().__init__(
             instructions=load_prompt("billing_prompt.yaml"),
-            llm=google.beta.realtime.RealtimeModel(
-                model=MODEL,
-                voice="Kore",  # custom voice for billing agent
-                temperature=TEMP,
-            ),
+            voice="Kore",  # custom voice for billing agent
         )
 
     @function_tool
@@ -150,11 +162,7 @@ async def entrypoint(ctx: JobContext):
 
     session = AgentSession[UserData](
         userdata=userdata,
-        llm=google.beta.realtime.RealtimeModel(  # default model and voice
-            model=MODEL,
-            voice="Puck",
-            temperature=TEMP,
-        ),
+        llm=_realtime_model("Puck"),  # default model and voice
     )
 
     await session.start(
@@ -1,6 +1,22 @@
 import os
+from functools import lru_cache
+
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+@lru_cache(maxsize=None)
+def _parse_prompt(prompt_path):
+    """Parse a prompt YAML file. Errors propagate, so only successes are cached."""
+
+    with open(prompt_path, "r") as file:
+        prompt_data = yaml.load(file, Loader=SafeLoader)
+        return prompt_data.get("instructions", "")
+
 
 def load_prompt(filename):
     """Load a prompt from a YAML file."""
@@ -9,9 +25,7 @@ def load_prompt(filename):
     prompt_path = os.path.join(script_dir, "prompts", filename)
 
     try:
-        with open(prompt_path, "r") as file:
-            prompt_data = yaml.safe_load(file)
-            return prompt_data.get("instructions", "")
+        return _parse_prompt(prompt_path)
     except (FileNotFoundError, yaml.YAMLError) as e:
         print(f"Error loading prompt file {filename}: {e}")
         return ""